@@ -29,6 +29,9 @@
 #     widest features (previously, one order of magnitude).
 # 16. The default frequency range rounds to decades of Hz or rad/s, depending on
 #     the unit used to plot frequency.
+# 17. The frequency response is evaluated as a complex array (evalfr()) and
+#     passed to the plotting functions instead of magnitude and phase.
+# 18. Using numpy.unwrap() instead of control.ctrlutil.unwrap()
 
 # Author: Richard M. Murray
 # Date: 24 May 09
@@ -76,7 +79,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from functools import wraps
-from control.ctrlutil import unwrap
 
 from .texunit import quantity_str, number_label
 from .util import add_hlines, add_vlines
@@ -87,7 +89,39 @@ s = 1
 cyc = 2 * np.pi * rad
 deg = cyc / 360
 Hz = cyc / s
-to_dB = lambda x: 20 * np.log10(x)
+
+# Group id of the reference lines that show the axes in a Nyquist plot
+_AXES_GID = 'nyquist-axes'
+
+# Cache of logarithmically spaced grids (see _log_grid())
+_LOG_GRIDS = {}
+_MAX_LOG_GRIDS = 32
+
+
+def mag2_to_dB(mag2):
+    """Return the magnitude in dB given the squared magnitude (*mag2*, not the
+    magnitude itself).
+    """
+    return 10 * np.log10(mag2)
+
+
+def _log_grid(e0, e1, n):
+    """Return *n* logarithmically spaced values from 10**e0 to 10**e1.
+
+    The grids are cached because parameter studies request the same range
+    repeatedly.  The result is read-only; scale it into a new array instead of
+    modifying it in place.
+    """
+    key = (float(e0), float(e1), int(n))
+    try:
+        return _LOG_GRIDS[key]
+    except KeyError:
+        if len(_LOG_GRIDS) >= _MAX_LOG_GRIDS:
+            _LOG_GRIDS.clear()
+        grid = np.logspace(*key)
+        grid.flags.writeable = False
+        _LOG_GRIDS[key] = grid
+        return grid
 
 
 def default_frequency_range(syslist, in_Hz=True):
@@ -121,7 +155,7 @@ def default_frequency_range(syslist, in_Hz=True):
              6.28318531e+03])
     """
     # Find the list of all poles and zeros in the systems.
-    features = []
+    features = [np.zeros(0)]
 
     # Put the single system in a list if necessary.
     if not getattr(syslist, '__iter__', False):
@@ -130,12 +164,14 @@ def default_frequency_range(syslist, in_Hz=True):
     for sys in syslist:
         try:
             # Add new features to the list.
-            features = np.concatenate((features, np.abs(sys.pole()) * rad / s))
-            features = np.concatenate((features, np.abs(sys.zero()) * rad / s))
+            features.append(np.abs(sys.pole()))
+            features.append(np.abs(sys.zero()))
         except:
             pass
 
-    # Get rid of poles and zeros at the origin.
+    # Join the features (once, rather than growing an array for each system)
+    # and get rid of poles and zeros at the origin.
+    features = np.concatenate(features) * rad / s
     features = features[features != 0]
 
     # Make sure there is at least one point in the range.
@@ -151,10 +187,68 @@ def default_frequency_range(syslist, in_Hz=True):
     unit = Hz if in_Hz else rad / s
     e0 = np.floor(np.min(features) / unit) - 2
     e1 = np.ceil(np.max(features) / unit) + 2
-    return np.logspace(e0, e1, (e1 - e0) * 20 + 1) * unit
+    return _log_grid(e0, e1, (e1 - e0) * 20 + 1) * unit
     # 20 matches the default skip in nyquist_plot().
 
 
+def evalfr(sys, omega):
+    """Return the complex frequency response of a SISO system.
+
+    **Parameters:**
+
+    - *sys*: Linear input/output system (Lti)
+
+    - *omega*: Array of angular frequencies in rad/s
+
+    **Returns:**
+
+    1. Complex response at each frequency (array)
+
+    If the system is discrete-time, then it is evaluated at z = exp(j*omega*dt)
+    instead of s = j*omega.
+
+    **Example:**
+
+    >>> from control.matlab import ss
+
+    >>> sys = ss("1. -2; 3. -4", "5.; 7", "6. 8", "9.")
+    >>> H = evalfr(sys, [0, 1])
+    >>> print(H[0].real)
+    59.0
+
+    >>> sys = ss("0.5", "1.", "1.", "0.", 0.1)  # Discrete-time
+    >>> H = evalfr(sys, [1])
+    >>> abs(H[0] - 1/(np.exp(0.1j) - 0.5)) < 1e-12
+    True
+    """
+    omega = np.asarray(omega, dtype=float)
+    try:
+        A, B, C, D = [np.atleast_2d(np.asarray(M, dtype=float))
+                      for M in (sys.A, sys.B, sys.C, sys.D)]
+    except AttributeError:
+        # The system isn't in state-space form; use its own evaluation.
+        mag, phase = sys.freqresp(omega)[0:2]
+        return np.squeeze(mag) * np.exp(1j * np.squeeze(phase))
+    n_x = A.shape[0] if A.size else 0
+    if n_x == 0:
+        return D[0, 0] * np.ones(omega.shape, dtype=complex)
+
+    # Determine the complex frequencies.  If the system is discrete-time, then
+    # dt is its sampling period (or True if it is unspecified, which is taken
+    # as 1).
+    dt = getattr(sys, 'dt', 0)
+    if dt:
+        s = np.exp(1j * omega * (1 if dt is True else dt))
+    else:
+        s = 1j * omega
+
+    # Solve (s*I - A)*x = B at all of the frequencies at once (one stacked
+    # LAPACK call).  B is broadcast rather than copied for each frequency.
+    M = s[:, np.newaxis, np.newaxis] * np.eye(n_x) - A
+    b = np.broadcast_to(B, (omega.size, n_x, 1))
+    return np.linalg.solve(M, b)[:, :, 0].dot(C[0]) + D[0, 0]
+
+
 def require_SISO(func):
     """Decorate a function to require that the first argument is a SISO system.
     """
@@ -170,6 +264,43 @@ def require_SISO(func):
     return wrapped
 
 
+def get_freqs(sys, freqs=None, in_Hz=True):
+    """Return the frequencies at which the response of a system should be
+    evaluated.
+
+    **Parameters:**
+
+    - *sys*: Linear input/output system (Lti) or list of systems
+
+         This is only used if *freqs* is 'None'.
+
+    - *freqs*: List or frequencies or tuple of (min, max) frequencies
+
+         If *freqs* is 'None', then an appropriate range will be determined
+         automatically.
+
+    - *in_Hz*: If `True`, the frequencies (*freqs*) are in Hz (otherwise,
+      rad/s)
+
+    **Returns:**
+
+    1. Angular frequencies (array)
+    """
+    if freqs is None:
+        return default_frequency_range(sys, in_Hz)
+        # TODO: Do something smarter for discrete.
+    elif isinstance(freqs, tuple):
+        # Interpolate between the minimum and maximum frequencies.
+        assert len(freqs) == 2, ("The freqs tuple must be a pair with the "
+                                 "minimum and maximum frequencies.")
+        e = np.log10(freqs)
+        return _log_grid(e[0], e[1], (e[1] - e[0]) * 20 + 1) * (Hz if in_Hz
+                                                                 else rad / s)
+        # 20 matches the default skip in nyquist_plot().
+    else:
+        return freqs * (Hz if in_Hz else rad / s)
+
+
 def overload_freqs(func):
     """Decorate a function to accept frequencies via (min, max) or default
     ('None'), as well as a list of frequencies.
@@ -178,37 +309,20 @@ def overload_freqs(func):
     def wrapped(sys, freqs=None, in_Hz=True, *args, **kwargs):
         """Updated function
         """
-        if freqs is None:
-            f = default_frequency_range(sys, in_Hz)
-            # TODO: Do something smarter for discrete.
-        elif isinstance(freqs, tuple):
-            # Interpolate between the minimum and maximum frequencies.
-            assert len(freqs) == 2, ("The freqs tuple must be a pair with the "
-                                     "minimum and maximum frequencies.")
-            e = np.log10(freqs)
-            f = np.logspace(e[0], e[1], np.diff(e) * 20 + 1) * (Hz if in_Hz else
-                                                                rad / s)
-            # 20 matches the default skip in nyquist_plot().
-        else:
-            f = freqs * (Hz if in_Hz else rad / s)
-
-        return func(sys, f, in_Hz, *args, **kwargs)
+        return func(sys, get_freqs(sys, freqs, in_Hz), in_Hz, *args, **kwargs)
 
     return wrapped
 
 
 def via_system(func):
-    """Decorate a function to accept magnitude and phase via a system.
+    """Decorate a function to accept the complex frequency response via a
+    system.
     """
     @wraps(func)
     def wrapped(sys, f, *args, **kwargs):
         """Updated function
         """
-        mag, phase = sys.freqresp(f / (rad / s))[0:2]
-        mag = np.squeeze(mag)
-        phase = np.squeeze(phase) * rad
-
-        return func(mag, phase, f, *args, **kwargs)
+        return func(evalfr(sys, f / (rad / s)), f, *args, **kwargs)
 
     return wrapped
 
@@ -216,8 +330,7 @@ def via_system(func):
 @require_SISO  # TODO: Support MIMO.
 @overload_freqs
 @via_system
-def bode_plot(mag, phase, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
-              axes=None, *args, **kwargs):
+def bode_plot(H, f, *args, **kwargs):
     r"""Create a Bode plot for a system.
 
     **Parameters:**
@@ -241,7 +354,8 @@ def bode_plot(mag, phase, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
 
     - *axes*: Tuple (pair) of axes to plot into
 
-         If 'None' or ('None', None*), then axes are created
+         If 'None' or ('None', 'None'), then axes are created.  Otherwise, the
+         plot is added to the given axes.
 
     - *\*args*, *\*\*kwargs*: Additional options to matplotlib (color,
       linestyle, etc.)
@@ -260,15 +374,39 @@ def bode_plot(mag, phase, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
        >>> sys = ss("1. -2; 3. -4", "5.; 7", "6. 8", "9.")
        >>> axes = bode_plot(sys)
     """
-    phase = unwrap(phase)
-    freq_unit = Hz if in_Hz else rad / s
+    return bode_plot_response(H, f, *args, **kwargs)
+
+
+def bode_plot_response(H, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
+                       axes=None, *args, **kwargs):
+    r"""Create a Bode plot from a precomputed frequency response.
+
+    **Parameters:**
+
+    - *H*: Complex frequency response (array)
+
+         Several responses may be given as the columns of a 2D array.  Then
+         each axes gets one line per response.
+
+    - *f*: Angular frequencies at which *H* was evaluated (array)
+
+    The other parameters and the return value are the same as for
+    :func:`bode_plot`.
+    """
+    # Take the magnitude and phase directly from the complex response.  The
+    # squared magnitude is enough for dB.
+    mag2 = H.real**2 + H.imag**2
+    phase = np.unwrap(np.arctan2(H.imag, H.real), axis=0) * rad
+
+    # Scale the frequencies once for both plots.
+    x = f / (Hz if in_Hz else rad / s)
 
     # Create axes if necessary.
-    if axes is None or (None, None):
+    if axes is None or tuple(axes) == (None, None):
         axes = (plt.subplot(211), plt.subplot(212))
 
     # Magnitude plot
-    axes[0].semilogx(f / freq_unit, to_dB(mag) if in_dB else mag,
+    axes[0].semilogx(x, mag2_to_dB(mag2) if in_dB else np.sqrt(mag2),
                      label=label, *args, **kwargs)
 
     # Add a grid and labels.
@@ -277,7 +415,7 @@ def bode_plot(mag, phase, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
     axes[0].set_ylabel("Magnitude in dB" if in_dB else "Magnitude")
 
     # Phase plot
-    axes[1].semilogx(f / freq_unit, phase / (deg if in_deg else rad),
+    axes[1].semilogx(x, phase / (deg if in_deg else rad),
                      label=label, *args, **kwargs)
 
     # Add a grid and labels.
@@ -292,9 +430,7 @@ def bode_plot(mag, phase, f, in_Hz=True, in_dB=True, in_deg=True, label=None,
 @require_SISO  # TODO: Support MIMO.
 @overload_freqs
 @via_system
-def nyquist_plot(mag, phase, f, in_Hz=True, label=None, mark=False,
-                 show_axes=True, skip=20, label_freq=True, ax=None, *args,
-                 **kwargs):
+def nyquist_plot(H, f, *args, **kwargs):
     r"""Create a Nyquist plot for a system.
 
     **Parameters:**
@@ -343,10 +479,26 @@ def nyquist_plot(mag, phase, f, in_Hz=True, label=None, mark=False,
        >>> sys = ss("1. -2; 3. -4", "5.; 7", "6. 8", "9.")
        >>> ax = nyquist_plot(sys)
     """
+    return nyquist_plot_response(H, f, *args, **kwargs)
+
 
-    # Compute the primary curve.
-    x = np.multiply(mag, np.cos(phase))
-    y = np.multiply(mag, np.sin(phase))
+def nyquist_plot_response(H, f, in_Hz=True, label=None, mark=False,
+                          show_axes=True, skip=20, label_freq=True, ax=None,
+                          *args, **kwargs):
+    r"""Create a Nyquist plot from a precomputed frequency response.
+
+    **Parameters:**
+
+    - *H*: Complex frequency response (array)
+
+    - *f*: Angular frequencies at which *H* was evaluated (array)
+
+    The other parameters and the return value are the same as for
+    :func:`nyquist_plot`.
+    """
+    # The primary curve is the complex response itself.
+    x = H.real
+    y = H.imag
 
     # Create axes if necessary.
     if ax is None:
@@ -358,10 +510,10 @@ def nyquist_plot(mag, phase, f, in_Hz=True, label=None, mark=False,
     ax.plot(x, y, linestyle='-', label=label, *args, **kwargs)
     ax.plot(x, -y, linestyle='--', *args, **kwargs)
 
-    # Show the axes.
-    if show_axes:
-        add_hlines(ax, color='k', linestyle='--', linewidth=0.5)
-        add_vlines(ax, color='k', linestyle='--', linewidth=0.5)
+    # Show the axes (only once if several responses are plotted together).
+    if show_axes and not any(line.get_gid() == _AXES_GID for line in ax.lines):
+        add_hlines(ax, color='k', linestyle='--', linewidth=0.5, gid=_AXES_GID)
+        add_vlines(ax, color='k', linestyle='--', linewidth=0.5, gid=_AXES_GID)
 
     # Mark the -1 point.
     if mark:
@@ -369,13 +521,16 @@ def nyquist_plot(mag, phase, f, in_Hz=True, label=None, mark=False,
 
     # Mark and label the frequencies.
     if skip:
-        for xpt, ypt, fpt in zip(x[::skip], y[::skip], f[::skip]):
-            # Mark the freqencies with a dot.
-            color = kwargs.pop('color', 'b')
-            ax.plot(xpt, ypt, '.', color=color)
+        xpts = x[::skip]
+        ypts = y[::skip]
+
+        # Mark the frequencies with dots (all in one line object).
+        ax.plot(xpts, ypts, '.', color=kwargs.get('color', 'b'),
+                rasterized=kwargs.get('rasterized'))
 
-            # Apply the text.
-            if label_freq:
+        # Apply the text.
+        if label_freq:
+            for xpt, ypt, fpt in zip(xpts, ypts, f[::skip]):
                 # Use a space before the text to prevent overlap with the data.
                 ax.text(xpt, ypt, ' ' + quantity_str(fpt / Hz, 'Hz', '%.0e',
                                                      roman=False))
@@ -58,14 +58,12 @@ import numpy as np
 import re
 
 from collections import namedtuple
-from control.matlab import ss
 from itertools import count
 from natu import core as nc
 from natu import units as U
 from natu.exponents import Exponents
 from natu.units import s as second
 from scipy.io import loadmat
-from scipy.io.matlab.mio_utils import chars_to_strings
 from six import PY2
 
 #from .._display import default_display_units
@@ -93,35 +91,56 @@ class Samples(namedtuple('Samples', ['times', 'signed_values', 'negated'])):
        return -self.signed_values if self.negated else self.signed_values
 
 
+def _join_rows(str_arr):
+    """Return the rows of a character array as one byte string, with each row
+    followed by a newline.
+
+    The characters are converted back to bytes in one pass, which undoes
+    scipy.io.loadmat's decoding using latin-1.  If a character isn't in
+    latin-1, then UnicodeEncodeError is raised.
+    """
+    rows, width = str_arr.shape
+    points = str_arr.view(np.uint32)
+    if points.size and points.max() > 255:
+        # Encode the first offending row to raise the usual error.
+        row = np.nonzero((points > 255).any(axis=1))[0][0]
+        ''.join(str_arr[row]).encode('latin-1')
+    codes = np.empty((rows, width + 1), dtype=np.uint8)
+    codes[:, :width] = points
+    codes[:, width] = ord('\n')
+    return codes.tobytes()
+
+
 if PY2:
     # For most strings (those besides the description), Unicode isn't
     # necessary.  Unicode support is less integrated in Python 2; Unicode
     # strings are a special case that are represented by u'...' (which is
     # distracting in the examples).  Therefore, in Python 2 we'll only use
     # Unicode for the description strings.
+    _PADDED_NEWLINE = re.compile(b'[ \0]*\n')
+
     def get_strings(str_arr):
         """Return a list of strings from a character array.
 
         Strip the whitespace from the right and return it to the character set
         it was saved in.
         """
-        return [line.rstrip(' \0').encode('latin-1')
-                for line in chars_to_strings(str_arr)]
-        # The encode part undoes scipy.io.loadmat's decoding.
+        return _PADDED_NEWLINE.split(_join_rows(str_arr))[:-1]
 else:
     # In Python 3, literal strings are Unicode by default
     # (http://stackoverflow.com/questions/6812031/how-to-make-unicode-string-with-python3),
     # and we need to leave the strings decoded because encoded strings are bytes
     # objects.
+    _PADDED_NEWLINE = re.compile('[ \0]*\n')
+
     def get_strings(str_arr):
         """Return a list of strings from a character array.
 
         Strip the whitespace from the right and recode it as utf-8.
         """
-        return [line.rstrip(' \0').encode('latin-1').decode('utf-8')
-                for line in chars_to_strings(str_arr)]
+        return _PADDED_NEWLINE.split(_join_rows(str_arr).decode('utf-8'))[:-1]
         # Modelica encodes using utf-8 but scipy.io.loadmat decodes using
-        # latin-1, thus the encode ... decode part.
+        # latin-1, thus the _join_rows() ... decode part.
 
 
 def _apply_unit(number, unit):
@@ -197,7 +216,7 @@ def loadtxt(file_name, variable_names=None, skip_header=1):
     return data
 
 
-def read(fname, constants_only=False):
+def read(fname, constants_only=False, variable_names=None):
     r"""Read variables from a MATLAB\ :sup:`®` (*.mat) or text file (*.txt) with
     Dymola\ :sup:`®`-formatted results.
 
@@ -210,6 +229,12 @@ def read(fname, constants_only=False):
     - *constants_only*: `True` to assume the result is from a simulation and
       read only the variables from the first data matrix
 
+    - *variable_names*: List of the names of the variables to read
+
+         If *variable_names* is 'None' (default), then all of the variables are
+         read.  It is ignored if *constants_only* is `True`.  The 'Aclass'
+         variable should be included.
+
     **Returns:**
 
     1. A dictionary of variable names and values
@@ -218,8 +243,9 @@ def read(fname, constants_only=False):
     """
 
     # Load the file.
-    variable_names = ['Aclass', 'name', 'names', 'description', 'dataInfo',
-                      'data', 'data_1'] if constants_only else None
+    if constants_only:
+        variable_names = ['Aclass', 'name', 'names', 'description', 'dataInfo',
+                          'data', 'data_1']
     try:
         data = loadmat(fname, variable_names=variable_names,
                        chars_as_strings=False, appendmat=False)
@@ -454,8 +480,13 @@ def readlin(fname):
 
     # pylint: disable=I0011, W0621
 
+    # python-control is slow to import, and it is only needed here (not for
+    # simulation results).
+    from control import ss
+
     # Load the file.
-    data, Aclass = read(fname)
+    required = ['nx', 'xuyName', 'ABCD']
+    data, Aclass = read(fname, variable_names=['Aclass'] + required)
 
     # Check the type of results.
     if Aclass[0] == 'Atrajectory':
@@ -463,19 +494,20 @@ def readlin(fname):
                              "instead.")
     assert Aclass[0] == 'AlinearSystem', (fname + " isn't a simulation or "
                                           "linearization result.")
+    missing = [name for name in required if name not in data]
+    assert not missing, ('%s is missing the following matrices: %s'
+                         % (fname, ', '.join(missing)))
 
-    # Determine the number of states, inputs, and outputs.
+    # Determine the number of states and inputs (the rest are outputs).
     ABCD = data['ABCD']
-    nx = data['nx'][0]
+    nx = int(data['nx'].flat[0])
     nu = ABCD.shape[1] - nx
-    ny = ABCD.shape[0] - nx
-
-    # Extract the system matrices.
-    A = ABCD[:nx, :nx] if nx > 0 else [[]]
-    B = ABCD[:nx, nx:] if nx > 0 and nu > 0 else [[]]
-    C = ABCD[nx:, :nx] if nx > 0 and ny > 0 else [[]]
-    D = ABCD[nx:, nx:] if nu > 0 and ny > 0 else [[]]
-    sys = ss(A, B, C, D)
+
+    # Extract the system matrices.  They are kept in Fortran (column-major)
+    # order, which is how they are stored in the file and used by LAPACK.  The
+    # slices have consistent shapes even if there are no states.
+    sys = ss(*[np.asfortranarray(M) for M in [ABCD[:nx, :nx], ABCD[:nx, nx:],
+                                              ABCD[nx:, :nx], ABCD[nx:, nx:]]])
 
     # Extract the variable names.
     xuyName = data['xuyName']
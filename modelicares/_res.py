@@ -14,6 +14,7 @@ __license__ = "BSD-compatible (see LICENSE.txt)"
 
 import os
 from functools import wraps
+from operator import attrgetter
 from .util import cast_sametype, basename
 
 
@@ -103,18 +104,33 @@ class Res(object):
         # Note:  The class name is inquired so that this method will still be
         # correct if the class is extended.
 
+    @property
+    def fname(self):
+        """Filename from which the variables were loaded, with absolute path
+        """
+        return self._fname
+
+    @fname.setter
+    def fname(self, fname):
+        """Set the filename and split it into the directory and the base
+        filename.
+        """
+        self._fname = fname
+        self._dirname = os.path.dirname(fname)
+        self._fbase = basename(fname)
+
     @property
     def dirname(self):
         """Directory from which the variables were loaded
         """
-        return os.path.dirname(self.fname)
+        return self._dirname
 
     @property
     def fbase(self):
         """Base filename from which the variables were loaded, without the
         directory or file extension
         """
-        return basename(self.fname)
+        return self._fbase
 
 
 class ResList(list):
@@ -140,7 +156,7 @@ class ResList(list):
         """If this class does not have attribute *attr*, return a list of
         that attribute from the entries in an instance of this class.
         """
-        return [getattr(res, attr) for res in self]
+        return list(map(attrgetter(attr), self))
 
     def __getitem__(self, i):
         """x.__getitem__(y) <==> x[y]
@@ -174,8 +190,9 @@ class ResList(list):
     def dirname(self):
         """Highest common directory that the result files share
         """
-        fnames = [item.fname.rpartition(os.sep)[0] for item in self]
-        return os.path.commonprefix(fnames).rstrip(os.sep)
+        # The directory of each result is cached in the result itself.
+        dirnames = list(map(attrgetter('dirname'), self))
+        return os.path.commonprefix(dirnames).rstrip(os.sep)
 
     @property
     def fnames(self):
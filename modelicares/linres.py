@@ -9,6 +9,12 @@ Modelica_ linearizations:
 - :class:`LinResList` - Specialized list of linearization results
   (:class:`LinRes` instances)
 
+.. Note::  The Bode and Nyquist plots of large MIMO systems or of many
+   linearizations contain many curves, which can bloat vector (PDF or SVG)
+   output.  To keep the files small, pass ``rasterized=True`` to
+   :meth:`LinRes.bode`, :meth:`LinRes.nyquist`, :meth:`LinResList.bode`, or
+   :meth:`LinResList.nyquist`.
+
 
 .. _Modelica: http://www.modelica.org/
 """
@@ -27,16 +33,27 @@ __license__ = "BSD-compatible (see LICENSE.txt)"
 
 import os
 import numpy as np
+import threading
+import warnings
+import weakref
 
-from control.matlab import ss
+from collections import namedtuple
 from functools import wraps
-from matplotlib.cbook import iterable
+from itertools import cycle
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 from natu.util import multiglob
-from scipy.signal import ss2tf
+from scipy.linalg import eig, eigvals, schur
 from six import string_types
+try:
+    from scipy.linalg import matrix_balance
+except ImportError:
+    # For SciPy < 0.19:
+    matrix_balance = None
 
 from . import util
-from ._freqplot import bode_plot, nyquist_plot
+from ._freqplot import (bode_plot_response, get_freqs,
+                        nyquist_plot_response)
 from ._res import Res, ResList
 
 # File loading functions
@@ -44,6 +61,252 @@ from ._io.dymola import readlin as dymola
 READERS = [('dymola', dymola)]  # LinRes tries these in order.
 # All of the keys should be in lowercase.
 
+_LOADED = {}  # Systems by (tool, filename), with the files' (mtime, size)
+_MAX_LOADED = 64
+# Systems that are still in use, by (tool, filename, (mtime, size)).  These are
+# shared even after they have been dropped from _LOADED.
+_IN_USE = weakref.WeakValueDictionary()
+_LOADED_LOCK = threading.Lock()  # for _LOADED and _IN_USE (see _get_lins())
+_MAX_FREQRESPS = 4  # Number of frequency responses each LinRes remembers
+
+
+def _read(tool, read, fname, pickled=False):
+    """Read a linearization from a file (*fname*) using a reader function
+    (*read*) named after a tool (*tool*).
+
+    The system is reused if the same file has already been read by the same
+    tool and it hasn't been modified since then.  The last few systems are
+    kept, and any others are reused as long as they are still in use.  If
+    *pickled* is `True`, then the system is also saved to *fname* + '.npz' so
+    that it can be reused across sessions.
+
+    This is thread-safe.  The file itself is read outside of the lock, so if
+    several threads read the same file at once, then the first system to be
+    stored is shared.
+    """
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return read(fname)  # The reader will give the error.
+    signature = (stat.st_mtime, stat.st_size)
+    key = (tool, fname)
+    with _LOADED_LOCK:
+        sys = _find_loaded(key, signature)
+    if sys is not None:
+        return sys
+
+    sys = _load_saved(fname + '.npz', (tool, signature)) if pickled else None
+    saved = sys is not None
+    if not saved:
+        sys = read(fname)
+    with _LOADED_LOCK:
+        loaded = _find_loaded(key, signature)
+        if loaded is not None:
+            return loaded  # Another thread has read the file meanwhile.
+        if len(_LOADED) >= _MAX_LOADED:
+            _LOADED.clear()
+        _LOADED[key] = signature, sys
+        _IN_USE[key + (signature,)] = sys
+    if pickled and not saved:
+        _save(fname + '.npz', (tool, signature), sys)
+    return sys
+
+
+def _find_loaded(key, signature):
+    """Return the system that has already been loaded given a key of (tool,
+    filename) and the file's signature, or 'None' if there isn't one.
+
+    This should be called with :data:`_LOADED_LOCK` held.
+    """
+    try:
+        loaded_signature, sys = _LOADED[key]
+    except KeyError:
+        pass
+    else:
+        if loaded_signature == signature:
+            return sys
+    return _IN_USE.get(key + (signature,))
+
+
+def _save(fname, signature, sys):
+    """Save a system (*sys*) to a NumPy file (*fname*) along with the signature
+    of its source as a tuple of (tool, (mtime, size)).
+
+    Only plain arrays are saved (the matrices, the names of the variables, and
+    the signature), so the file can be loaded without running any code.  If
+    the file can't be written (e.g., in a read-only directory), then nothing is
+    saved.
+    """
+    tool, stamp = signature
+    try:
+        with open(fname, 'wb') as npz:
+            np.savez(npz, tool=np.array(tool),
+                     stamp=np.array(stamp, dtype=float),
+                     A=sys.A, B=sys.B, C=sys.C, D=sys.D,
+                     state_names=np.array(sys.state_names, dtype=str),
+                     input_names=np.array(sys.input_names, dtype=str),
+                     output_names=np.array(sys.output_names, dtype=str))
+    except Exception:
+        # Don't leave a partial file.
+        try:
+            os.remove(fname)
+        except OSError:
+            pass
+
+
+def _load_saved(fname, signature):
+    """Return a system saved by :func:`_save` in a NumPy file (*fname*), or
+    'None' if the file can't be read or its signature doesn't match
+    *signature*.
+    """
+    from control import ss  # It is slow to import and only needed here.
+    tool, stamp = signature
+    try:
+        with open(fname, 'rb') as npz:
+            data = np.load(npz, allow_pickle=False)
+            if (data['tool'].item() != tool
+                or tuple(data['stamp'].tolist()) != stamp):
+                return None
+            sys = ss(*[np.asfortranarray(data[M]) for M in 'ABCD'])
+            sys.state_names = data['state_names'].tolist()
+            sys.input_names = data['input_names'].tolist()
+            sys.output_names = data['output_names'].tolist()
+    except Exception:
+        return None
+    return sys
+
+
+class _SISO(namedtuple('_SISO', ['A', 'B', 'C', 'D', 'pole', 'zero'])):
+
+    """Lightweight SISO state-space system
+
+    This has the parts of :class:`control.StateSpace` that are used by
+    :mod:`modelicares._freqplot`, but it is created without validating or
+    copying the matrices.  *pole* and *zero* are functions that return the
+    poles and zeros so that they can be shared among the SISO systems of a
+    MIMO system and computed only if needed.
+    """
+    __slots__ = ()
+    inputs = 1
+    outputs = 1
+
+
+def _map_threads(func, items, max_threads=None):
+    """Return a list of the results of a function (*func*) applied to each of a
+    list of items (*items*).
+
+    If there are several items, then they are processed in parallel threads (at
+    most *max_threads*, or the number of CPUs by default).
+    """
+    if len(items) < 2:
+        return [func(item) for item in items]
+    pool = ThreadPool(min(len(items), max_threads or cpu_count()))
+    try:
+        return pool.map(func, items)
+    finally:
+        # Wait for the worker threads to exit so that none are left behind.
+        pool.close()
+        pool.join()
+
+
+def _freqresps(lins, indices, freqs=None, in_Hz=True):
+    """Return the angular frequencies and the complex responses of an
+    input/output pair of each of a list of linearizations (2D array, with one
+    column per linearization).
+
+    **Parameters:**
+
+    - *lins*: List of :class:`LinRes` instances
+
+    - *indices*: List of (input index, output index) tuples, one for each
+      linearization
+
+    See :func:`~modelicares._freqplot.get_freqs` for *freqs* and *in_Hz*.  The
+    frequencies are shared by all of the responses so that they are sampled
+    alike.  By default, the range covers the poles and zeros of all of the
+    pairs.
+
+    Each response is taken from the all-pairs response of its linearization,
+    so the state matrix is decomposed once rather than solved at every
+    frequency.  The linearizations are processed in parallel threads since
+    NumPy and LAPACK release the GIL.
+    """
+    jobs = list(zip(lins, indices))
+
+    # Determine the frequencies.
+    if freqs is None:
+        def siso(job):
+            """Return the SISO system of a pair of a linearization, with its
+            poles and zeros found (and cached).
+            """
+            lin, (iu, iy) = job
+            sys = lin._siso(iu, iy)
+            sys.pole()
+            sys.zero()
+            return sys
+
+        f = get_freqs(_map_threads(siso, jobs), in_Hz=in_Hz)
+    else:
+        f = get_freqs(None, freqs, in_Hz)
+
+    def freqresp(job):
+        """Return the complex response of a pair of a linearization.
+        """
+        lin, (iu, iy) = job
+        return lin._freqresp_all(f)[:, iy, iu]
+
+    return f, np.column_stack(_map_threads(freqresp, jobs))
+
+
+def _bode_axes(label, reuse=False):
+    """Return a tuple (pair) of axes for the magnitude and phase plots in a
+    figure labeled *label*.
+
+    If *reuse* is `True`, then an existing figure with the same label is
+    cleared and reused (see :func:`~modelicares.util.figure`).
+    """
+    fig = util.figure(label, reuse=reuse)
+    if len(fig.axes) == 2:
+        return tuple(fig.axes)
+    fig.clf()
+    return fig.add_subplot(211), fig.add_subplot(212)
+
+
+def _nyquist_ax(label, reuse=False):
+    """Return axes for a Nyquist plot in a figure labeled *label*.
+
+    If *reuse* is `True`, then an existing figure with the same label is
+    cleared and reused (see :func:`~modelicares.util.figure`).
+    """
+    fig = util.figure(label, reuse=reuse)
+    if len(fig.axes) == 1:
+        ax = fig.axes[0]
+        ax.set_aspect('equal')
+        return ax
+    fig.clf()
+    return fig.add_subplot(111, aspect='equal')
+
+
+def _solve_shifted_triangular(s, T, R):
+    """Solve (s*I - T)*X = R at each of an array of complex frequencies (*s*),
+    where *T* is an upper triangular matrix.
+
+    The back-substitution proceeds row by row, and each step is a single
+    matrix-vector product over all of the frequencies and columns of *R*.
+
+    **Returns:** *X*, indexed by frequency and then as *R*
+    """
+    n = T.shape[0]
+    X = np.empty((n, s.size) + R.shape[1:], dtype=complex)
+    X[:] = R[:, np.newaxis]
+    X_rows = X.reshape(n, -1)
+    diag = (s - np.diag(T)[:, np.newaxis]).reshape((n, s.size)
+                                                    + (1,) * (R.ndim - 1))
+    for i in range(n - 1, -1, -1):
+        X_rows[i] += T[i, i + 1:].dot(X_rows[i + 1:])
+        X[i] /= diag[i]
+    return np.rollaxis(X, 1)
+
 
 def _from_names(meth):
     """Return a method that accepts names or indices to identify system inputs
@@ -66,37 +329,53 @@ def _from_names(meth):
 
              This must be specified unless the system has only one output.
         """
-        # Get the input index.
-        if iu is None:
-            if len(self.sys.input_names) == 1:
-                iu = 0
-            else:
-                raise IndexError("iu must be specified since this is a MI "
-                                 "system.")
-        elif not isinstance(iu, int):
-            try:
-                iu = self.sys.input_names.index(iu)
-            except ValueError:
-                raise ValueError('The input "%s" is invalid.' % iu)
+        return meth(self, *self._indices(iu, iy))
+
+    return wrapped
 
-        # Get the output index.
-        if iy is None:
-            if len(self.sys.output_names) == 1:
-                iy = 0
-            else:
-                raise IndexError("iy must be specified since this is a MO "
-                                 "system.")
-        elif not isinstance(iy, int):
-            try:
-                iy = self.sys.output_names.index(iy)
-            except ValueError:
-                raise ValueError('The output "%s" is invalid.' % iy)
 
-        return meth(self, iu, iy)
+def _cached_by_pair(meth):
+    """Decorate a method that takes input and output indices so that its
+    results are cached in the instance.
+
+    The cache is cleared whenever :attr:`LinRes.sys` is set.  Since the results
+    are shared, they should not be modified in place.
+    """
+    @wraps(meth)
+    def wrapped(self, iu, iy):
+        """Method that caches its result for each pair of indices
+        """
+        key = (meth.__name__, iu, iy)
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = meth(self, iu, iy)
+            return result
 
     return wrapped
 
 
+def _cached_property(meth):
+    """Return a read-only property that caches the result of a method in the
+    instance.
+
+    As for :func:`_cached_by_pair`, the cache is cleared whenever
+    :attr:`LinRes.sys` is set.
+    """
+    @wraps(meth)
+    def wrapped(self):
+        """Method that caches its result
+        """
+        key = meth.__name__
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = meth(self)
+            return result
+
+    return property(wrapped)
+
+
 class LinRes(Res):
 
     """Class for Modelica_-based linearization results and methods to analyze
@@ -116,10 +395,41 @@ class LinRes(Res):
          By default, the available functions are tried in order until one
          works (or none do).
 
+    - *pickled*: `True`, if the system should be cached in a NumPy file next
+      to the original file (*fname* + '.npz')
+
+         The cached file is used instead of the original file as long as the
+         original file hasn't been modified (by its modification time and
+         size).  This is faster for large linearizations.  If the directory
+         isn't writable, then the cached file is skipped.  It only contains
+         plain arrays (the matrices and the names of the variables), so it is
+         loaded without unpickling any objects.
+
+    - *dtype*: Floating point type of the matrices used for the analysis
+      (e.g., :class:`numpy.float32`)
+
+         Single precision halves the memory and is faster for the
+         eigendecomposition of large systems, but it should only be used for
+         well-conditioned systems.  A warning is given if the condition number
+         of the state matrix is above 1e6.  :attr:`sys` itself is not
+         converted.
+
+    - *lazy*: `True`, if the file should only be read once :attr:`sys` (or a
+      method that uses it) is first accessed
+
+         This is faster if only the filename is needed.  However, errors in
+         reading the file are only given at that point.
+
     **Methods:**
 
     - :meth:`bode` - Create a Bode plot of the system's response.
 
+    - :meth:`freqresp` - Return the complex frequency response given input and
+      output names.
+
+    - :meth:`freqresp_all` - Return the complex frequency response of all of the
+      input/output pairs.
+
     - :meth:`nyquist` - Create a Nyquist plot of the system's response.
 
     - :meth:`to_siso` - Return a SISO state-space system given input and output
@@ -139,6 +449,9 @@ class LinRes(Res):
 
     - :attr:`sys` - State-space system as an instance of :class:`control.StateSpace`
 
+         The system is shared by all of the instances that are loaded from the
+         same unmodified file, so it should not be modified in place.
+
          It contains:
 
          - :attr:`A`, :attr:`B`, :attr:`C`, :attr:`D`: Matrices of the linear
@@ -165,43 +478,60 @@ class LinRes(Res):
     Modelica linearization results from .../examples/PID.mat
     """
 
-    def __init__(self, fname='dslin.mat', tool=None):
+    def __init__(self, fname='dslin.mat', tool=None, pickled=False,
+                 dtype=float, lazy=False):
         """Upon initialization, read Modelica_ linearization results from a
         file.
 
         See the top-level class documentation.
         """
 
-        # Read the file.
-        fname = util.cleanpath(fname)
+        # Determine the reader(s).
         if tool is None:
-            # Read the file and store the data.
-            for tool, read in READERS[:-1]:
-                try:
-                    self.sys = read(fname)
-                except IOError:
-                    raise
-                except Exception as exception:
-                    print("The %s reader gave the following error message:\n%s"
-                          % (tool, exception.args[0]))
-                    print("Trying the next reader...")
-                    continue
-                else:
-                    break
-            tool, read = READERS[-1]
+            self._readers = READERS
         else:
             readerdict = dict(READERS)
             try:
-                read = readerdict[tool.lower()]
+                self._readers = [(tool, readerdict[tool.lower()])]
             except KeyError:
                 raise LookupError('"%s" is not one of the available tools '
                                   '("%s").' % (tool,
                                                '", "'.join(list(readerdict))))
-        self.sys = read(fname)
 
-        # Remember the tool and filename.
-        self.tool = tool
-        super(LinRes, self).__init__(fname)
+        # Remember the options and filename.
+        self._pickled = pickled
+        self._cache = {}
+        self.dtype = np.dtype(dtype)
+        super(LinRes, self).__init__(util.cleanpath(fname))
+
+        # Read the file.
+        if not lazy:
+            self._load()
+
+    def _load(self):
+        """Read the file and store the system and the tool used to read it.
+        """
+        fname = self.fname
+        readers = self._readers
+        for tool, read in readers[:-1]:
+            try:
+                sys = _read(tool, read, fname, self._pickled)
+            except IOError:
+                raise
+            except Exception as exception:
+                print("The %s reader gave the following error message:\n%s"
+                      % (tool, exception.args[0]))
+                print("Trying the next reader...")
+                continue
+            else:
+                break
+        else:
+            # None of the other readers worked (or there aren't any).  Let the
+            # last one give its own error if it doesn't work either.
+            tool, read = readers[-1]
+            sys = _read(tool, read, fname, self._pickled)
+        self.sys = sys
+        self._tool = tool
 
     def __str__(self):
         """Return an informal description of the :class:`LinRes` instance.
@@ -214,10 +544,331 @@ class LinRes(Res):
         """
         return "Modelica linearization results from " + self.fname
 
+    @property
+    def sys(self):
+        """State-space system as an instance of :class:`control.StateSpace`
+        """
+        try:
+            return self._sys
+        except AttributeError:
+            # The file hasn't been read yet (*lazy*).
+            self._load()
+            return self._sys
+
+    @sys.setter
+    def sys(self, sys):
+        """Set the state-space system and forget the results derived from the
+        previous one.
+        """
+        self._sys = sys
+        self._cache = {}
+
+    @property
+    def tool(self):
+        """String indicating the function used to read the results (named after
+        the corresponding Modelica_ tool)
+        """
+        self.sys  # Read the file if it hasn't been read yet.
+        return self._tool
+
+    @_cached_property
+    def _A(self):
+        """State matrix as a 2D array in Fortran order (as used by LAPACK)
+        """
+        A = np.asfortranarray(self.sys.A, dtype=float)
+        if (np.finfo(self.dtype).eps > np.finfo(float).eps and A.size
+            and np.linalg.cond(A) > 1e6):
+            warnings.warn("The state matrix of %s is ill-conditioned, so its "
+                          "analysis in %s may be inaccurate."
+                          % (self.fname, self.dtype.name))
+        return A.astype(self.dtype, order='F', copy=False)
+
+    @_cached_property
+    def _B(self):
+        """Input matrix as a 2D array
+
+        Unless the data type is changed, this is a view of the system's matrix,
+        not a copy.  The columns for individual inputs are sliced from it as
+        needed.
+        """
+        return np.asarray(self.sys.B, dtype=self.dtype)
+
+    @_cached_property
+    def _C(self):
+        """Output matrix as a 2D array
+
+        Unless the data type is changed, this is a view of the system's matrix,
+        not a copy.  The rows for individual outputs are sliced from it as
+        needed.
+        """
+        return np.asarray(self.sys.C, dtype=self.dtype)
+
+    @_cached_property
+    def _D(self):
+        """Feedthrough matrix as a 2D array
+        """
+        return np.asarray(self.sys.D, dtype=self.dtype)
+
+    @_cached_property
+    def _eigA(self):
+        """Eigendecomposition of the state matrix as a tuple of (eigenvalues,
+        eigenvectors, inverse of the eigenvectors)
+
+        The inverse is 'None' if the eigenvectors are too ill-conditioned to
+        diagonalize the state matrix reliably.
+        """
+        # Decompose the balanced matrix (D^-1*A*D, where D is diagonal).  Its
+        # eigenvectors are better conditioned, and they are scaled back by D.
+        A = self._A
+        if matrix_balance is None:
+            scale = np.ones(A.shape[0])
+        else:
+            A, (scale, _) = matrix_balance(A, permute=False, separate=True)
+        lam, V = eig(A, overwrite_a=A is not self._A)
+        # If A was balanced, then it's a new array that LAPACK can overwrite.
+        # The limit on the condition number is relative to the precision.
+        limit = 1e12 * np.finfo(float).eps / np.finfo(A.dtype).eps
+        Vinv = np.linalg.inv(V) if np.linalg.cond(V) < limit else None
+        return (lam, scale[:, np.newaxis] * V,
+                None if Vinv is None else Vinv / scale)
+
+    @_cached_property
+    def _modal(self):
+        """Modal form of the system as a tuple of (eigenvalues, C*V, V^-1*B),
+        or 'None' if the state matrix can't be diagonalized reliably (see
+        :attr:`_eigA`)
+        """
+        lam, V, Vinv = self._eigA
+        if Vinv is None:
+            return None
+        return lam, self._C.dot(V), Vinv.dot(self._B)
+
+    @_cached_property
+    def _schur(self):
+        """Schur form of the system as a tuple of (upper triangular matrix T,
+        Z^H*B, C*Z), where A = Z*T*Z^H is the complex Schur decomposition of the
+        state matrix
+        """
+        T, Z = schur(self._A, output='complex')
+        return T, Z.conj().T.dot(self._B), self._C.dot(Z)
+
+    @_cached_property
+    def _char_poly(self):
+        """Coefficients of the characteristic polynomial of the system (the
+        common denominator of its transfer functions)
+        """
+        # The roots may be in single precision (see *dtype*), but the
+        # coefficients are expanded in double precision.
+        poly = (np.poly(np.asarray(self._poles, dtype=complex))
+                if self._A.size else np.ones(1))
+        poly.flags.writeable = False  # since it is shared
+        return poly
+
+    @_cached_property
+    def _poles(self):
+        """Poles of the system (eigenvalues of the state matrix)
+        """
+        A = self._A
+        if not A.size:
+            return np.zeros(0)
+        if '_eigA' in self._cache:
+            return self._eigA[0]
+        return eigvals(A)  # Skip the eigenvectors if they aren't needed yet.
+
+    @_cached_property
+    def _input_index(self):
+        """Dictionary of the indices of the inputs by name
+        """
+        return dict((name, i) for i, name in enumerate(self.sys.input_names))
+
+    @_cached_property
+    def _output_index(self):
+        """Dictionary of the indices of the outputs by name
+        """
+        return dict((name, i) for i, name in enumerate(self.sys.output_names))
+
+    @_cached_property
+    def _all_pairs(self):
+        """List of all (input index, output index) pairs of the system
+
+        The outputs vary fastest, so the pairs of each input (column of B) are
+        together.
+        """
+        return np.indices((self.sys.inputs, self.sys.outputs)
+                         ).reshape(2, -1).T.tolist()
+
+    def _indices(self, iu=None, iy=None):
+        """Return the indices of an input and an output given their names or
+        indices.
+
+        See :func:`_from_names` for the parameters.
+        """
+        # Get the input index.
+        if iu is None:
+            if len(self.sys.input_names) == 1:
+                iu = 0
+            else:
+                raise IndexError("iu must be specified since this is a MI "
+                                 "system.")
+        elif isinstance(iu, string_types):
+            try:
+                iu = self._input_index[iu]
+            except KeyError:
+                raise ValueError('The input "%s" is invalid.' % iu)
+
+        # Get the output index.
+        if iy is None:
+            if len(self.sys.output_names) == 1:
+                iy = 0
+            else:
+                raise IndexError("iy must be specified since this is a MO "
+                                 "system.")
+        elif isinstance(iy, string_types):
+            try:
+                iy = self._output_index[iy]
+            except KeyError:
+                raise ValueError('The output "%s" is invalid.' % iy)
+
+        return iu, iy
+
+    def _freqresp_all(self, omega):
+        """Return the complex frequency response of all of the input/output
+        pairs at once.
+
+        **Parameters:**
+
+        - *omega*: Angular frequencies in rad/s (array)
+
+        **Returns:**
+
+        1. Complex response (3D array indexed by frequency, output, and input)
+
+        The response is remembered for the last few sets of frequencies (e.g.,
+        for a Bode plot and then a Nyquist plot), so it should not be modified
+        in place.
+        """
+        omega = np.asarray(omega, dtype=float)
+        responses = self._cache.setdefault('_freqresp_all', {})
+        key = omega.tobytes()
+        try:
+            return responses[key]
+        except KeyError:
+            pass
+        H = self._eval_freqresp(1j * omega)
+        H.flags.writeable = False  # since it is shared
+        if len(responses) >= _MAX_FREQRESPS:
+            responses.clear()
+        responses[key] = H
+        return H
+
+    def _eval_freqresp(self, s):
+        """Evaluate the complex frequency response of all of the input/output
+        pairs at an array of complex frequencies (*s*).
+
+        The state matrix is diagonalized once (A = V*diag(lambda)*V^-1) so
+        that the response at every frequency is
+        C*V*diag(1/(s - lambda))*V^-1*B + D, which is a broadcast over all of
+        the pairs.  C*V and V^-1*B are kept with the system (:attr:`_modal`).
+        If A isn't safely diagonalizable, then it is reduced to
+        complex Schur form once (A = Z*T*Z^H), and the triangular system
+        (sI - T)*X = Z^H*B is back-substituted at each frequency instead
+        (:attr:`_schur`).
+        """
+        if not self._A.size:
+            # There are no states.
+            return np.tile(self._D.astype(complex), (s.size, 1, 1))
+        modal = self._modal
+        if modal is not None:
+            # Scale the columns of C*V at each frequency and let BLAS do the
+            # rest in one matrix product.
+            lam, CV, VinvB = modal
+            CVR = CV * (1 / (s[:, np.newaxis] - lam))[:, np.newaxis, :]
+            return CVR.dot(VinvB) + self._D
+        # Fall back to the Schur form.
+        T, ZhB, CZ = self._schur
+        X = _solve_shifted_triangular(s, T, ZhB)
+        return np.matmul(CZ, X) + self._D
+
+    def _freqresp_pairs(self, pairs, kwargs):
+        """Return the frequencies and the complex response of all of the
+        input/output pairs for a plot.
+
+        *pairs* is a list of (input index, output index) tuples.  *freqs* is
+        popped from the dictionary of plotting arguments (*kwargs*).  If it
+        isn't given, then the frequency range is chosen to cover the poles and
+        zeros of all of the pairs.
+        """
+        freqs = kwargs.pop('freqs', None)
+        sys = ([self._siso(iu, iy) for iu, iy in pairs] if freqs is None
+               else self.sys)
+        f = get_freqs(sys, freqs, kwargs.get('in_Hz', True))
+        return f, self._freqresp_all(f)
+
+    @staticmethod
+    def _pick_pairs(H, pairs):
+        """Return the responses of a list of (input index, output index) pairs
+        (*pairs*) from the complex response of all of the pairs (*H*, indexed
+        by frequency, output, and input).
+
+        The responses are gathered in one step, with each pair's response as a
+        contiguous row.
+        """
+        iu, iy = np.array(pairs).T
+        return H[:, iy, iu].T
+
+    @_from_names
+    @_cached_by_pair
+    def _siso(self, iu, iy):
+        """Return a lightweight SISO system (:class:`_SISO`) given input and
+        output names or indices.
+
+        The matrices are shared with the MIMO system, so they should not be
+        modified in place.
+        """
+        return _SISO(self._A, self._B[:, iu:iu + 1], self._C[iy:iy + 1],
+                     self._D[iy:iy + 1, iu:iu + 1], lambda: self._poles,
+                     lambda: self._zeros(iu, iy))
+
+    @_cached_by_pair
+    def _residues(self, iu, iy):
+        """Return the residues of the transfer function at the poles (in the
+        order of :attr:`_modal`) given input and output indices, or 'None' if
+        the state matrix can't be diagonalized reliably
+        """
+        modal = self._modal
+        if modal is None:
+            return None
+        _, CV, VinvB = modal
+        return CV[iy] * VinvB[:, iu]
+
+    @_cached_by_pair
+    def _zeros(self, iu, iy):
+        """Return the zeros of the transfer function given input and output
+        indices.
+        """
+        num, den = self.to_tf(iu, iy)
+        num = num[0]
+        # The numerator is the difference of two polynomials (see to_tf()), so
+        # its leading coefficients are only round-off where the terms cancel
+        # (e.g., if the relative degree is above one).  Those coefficients would
+        # give large, spurious zeros, so trim the ones that are negligible
+        # relative to the terms that cancelled.
+        d = self._D[iy, iu]
+        scale = np.maximum(abs(num - (d - 1) * den), abs((d - 1) * den))
+        tol = den.size * np.sqrt(np.finfo(self.dtype).eps)
+        significant = np.flatnonzero(abs(num) > tol * scale)
+        if not significant.size:
+            return np.zeros(0)
+        return np.roots(num[significant[0]:])
+
     @_from_names
+    @_cached_by_pair
     def to_siso(self, iu, iy):
         """Return a SISO system given input and output indices.
 
+        The system is cached for each pair of input and output, so it should
+        not be modified in place.
+
         **Parameters:**
 
         - *iu*: Index or name of the input
@@ -243,13 +894,17 @@ class LinRes(Res):
         D = [[ 11.]]
         <BLANKLINE>
         """
-        return ss(self.sys.A, self.sys.B[:, iu],
-                  self.sys.C[iy, :], self.sys.D[iy, iu])
+        from control import ss  # It is slow to import and only needed here.
+        return ss(*self._siso(iu, iy)[:4])
 
     @_from_names
+    @_cached_by_pair
     def to_tf(self, iu, iy):
         """Return a transfer function given input and output names.
 
+        The result is cached for each pair of input and output, so it should not
+        be modified in place.
+
         **Parameters:**
 
         - *iu*: Index or name of the input
@@ -266,13 +921,96 @@ class LinRes(Res):
         >>> lin.to_tf()
         (array([[  11.,  102.,  200.]]), array([   1.,  100.,    0.]))
         """
-        # Return the TF.
-        return ss2tf(self.sys.A, self.sys.B,
-                     self.sys.C[iy, :], self.sys.D[iy, :], input=iu)
+        # All of the transfer functions share the characteristic polynomial as
+        # the denominator.  The numerator follows from
+        # det(sI - A + b*c) = det(sI - A)*(1 + c*(sI - A)^-1*b).
+        den = self._char_poly
+        d = self._D[iy, iu]
+        if den.size == 1:
+            # There are no states.
+            return np.array([[d]]), den
+        roots = eigvals(self._A - self._B[:, iu:iu + 1] * self._C[iy:iy + 1])
+        num = np.poly(np.asarray(roots, dtype=complex)) + (d - 1) * den
+        return num[np.newaxis, :], den
+
+    def freqresp(self, freqs, iu=None, iy=None, in_Hz=True):
+        """Return the complex frequency response given input and output names.
+
+        **Parameters:**
+
+        - *freqs*: List or array of frequencies
+
+        - *iu*: Index or name of the input
+
+             This must be specified unless the system has only one input.
+
+        - *iy*: Index or name of the output
+
+             This must be specified unless the system has only one output.
+
+        - *in_Hz*: `True`, if the frequencies are in Hz (otherwise, rad/s)
+
+        **Returns:**
+
+        1. Complex response at each frequency (array)
+
+        The response is evaluated as a sum of partial fractions,
+        sum(r_k/(s - p_k)) + d, where the poles (p_k) and the residues (r_k) of
+        the pair are cached.  If the state matrix can't be diagonalized
+        reliably, then it is evaluated from the Schur form instead.
+
+        **Example:**
+
+        >>> lin = LinRes('examples/PID.mat')
+        >>> H = lin.freqresp([0.1, 1, 10])
+        >>> print(round(abs(H[2]), 3))
+        5.889
+        """
+        iu, iy = self._indices(iu, iy)
+        omega = np.asarray(freqs, dtype=float) * (2 * np.pi if in_Hz else 1)
+        if not self._A.size:
+            # There are no states.
+            return np.full(omega.shape, self._D[iy, iu], dtype=complex)
+        residues = self._residues(iu, iy)
+        if residues is None:
+            return self._freqresp_all(omega.ravel())[:, iy, iu].reshape(
+                omega.shape)
+        lam = self._modal[0]
+        return ((1 / (1j * omega[..., np.newaxis] - lam)).dot(residues)
+                + self._D[iy, iu])
+
+    def freqresp_all(self, freqs, in_Hz=True):
+        """Return the complex frequency response of all of the input/output
+        pairs.
+
+        **Parameters:**
+
+        - *freqs*: List or array of frequencies
+
+        - *in_Hz*: `True`, if the frequencies are in Hz (otherwise, rad/s)
+
+        **Returns:**
+
+        1. Complex response (3D array indexed by output, input, and frequency)
+
+        All of the pairs are evaluated at once from a decomposition of the state
+        matrix, which is shared with :meth:`bode` and :meth:`nyquist`.  The
+        result is a read-only view of the cached response, so it should be
+        copied before it is modified.
+
+        **Example:**
+
+        >>> lin = LinRes('examples/PID.mat')
+        >>> lin.freqresp_all([0.1, 1, 10]).shape
+        (1, 1, 3)
+        """
+        omega = np.asarray(freqs, dtype=float) * (2 * np.pi if in_Hz else 1)
+        return self._freqresp_all(omega).transpose(1, 2, 0)
 
     def bode(self, axes=None, pairs=None, label='bode',
              title=None, colors=['b', 'g', 'r', 'c', 'm', 'y', 'k'],
-             styles=[(None, None), (3, 3), (1, 1), (3, 2, 1, 2)], **kwargs):
+             styles=[(None, None), (3, 3), (1, 1), (3, 2, 1, 2)], legend=True,
+             **kwargs):
         r"""Create a Bode plot of the system's response.
 
         The Bode plots of a MIMO system are overlayed. This is different than
@@ -283,7 +1021,10 @@ class LinRes(Res):
         - *axes*: Tuple (pair) of axes for the magnitude and phase plots
 
              If *axes* is not provided, then axes will be created in a new
-             figure.
+             figure.  Pass the axes returned by a previous call to add to the
+             same plot instead of creating another figure.  If *axes* is
+             'reuse', then the figure labeled *label* is cleared and reused if
+             it exists.
 
         - *pairs*: List of (input name or index, output name or index) tuples of
           each transfer function to be evaluated
@@ -318,6 +1059,9 @@ class LinRes(Res):
              .. Seealso::
                 http://matplotlib.sourceforge.net/api/collections_api.html
 
+        - *legend*: `True`, if a legend should be added when there is more than
+          one pair
+
         - *\*\*kwargs*: Additional plotting arguments:
 
              - *freqs*: List or frequencies or tuple of (min, max) frequencies
@@ -335,7 +1079,8 @@ class LinRes(Res):
                (otherwise, radians)
 
              Other keyword arguments are passed to
-             :func:`matplotlib.pyplot.plot`.
+             :func:`matplotlib.pyplot.plot` (e.g., *rasterized*; see the
+             note in :mod:`modelicares.linres`).
 
         **Returns:**
 
@@ -347,59 +1092,66 @@ class LinRes(Res):
            :alt: Bode plot of PID
         """
         # Create axes if necessary.
-        if axes is None or (None, None):
-            fig = util.figure(label)
-            axes = (fig.add_subplot(211), fig.add_subplot(212))
+        reuse = isinstance(axes, string_types) and axes == 'reuse'
+        if axes is None or reuse or tuple(axes) == (None, None):
+            axes = _bode_axes(label, reuse)
 
         # Create a title if necessary.
         if title is None:
             title = "Bode plot of " + self.fbase
 
         # Set up the color(s) and line style(s).
-        if not iterable(colors):
+        if not util.iterable(colors):
             # Use the single color for all plots.
             colors = (colors,)
-        if not iterable(styles) or isinstance(styles[0], int):
+        if not util.iterable(styles) or isinstance(styles[0], int):
             # Use the single line or dashes style for all plots.
             styles = [styles]
-        n_colors = len(colors)
-        n_styles = len(styles)
-
-        # If input/output pair(s) aren't specified, generate a list of all
-        # pairs.
-        if not pairs:
-            pairs = [(iu, iy) for iu in range(self.sys.inputs)
-                     for iy in range(self.sys.outputs)]
 
-        # Create the plots.
-        for i, (iu, iy) in enumerate(pairs):
-            style = styles[np.mod(i, n_styles)]
-            if isinstance(style, string_types):
-                kwargs['linestyle'] = style
-                kwargs.pop('dashes', None)
-            else:
-                kwargs['dashes'] = style
-                kwargs.pop('linestyle', None)
-            bode_plot(self.to_siso(iu, iy), axes=axes,
-                      label='$Y_{%i}/U_{%i}$' % (iy, iu),
-                      color=colors[np.mod(i, n_colors)], **kwargs)
-            # Note: ._freqplot.bode() is currently only implemented for
-            # SISO systems.
-            # 5/23/11: Since ._freqplot.bode() already uses subplots for
-            # the magnitude and phase plots, it would be difficult to modify
-            # the code to put the Bode plots of a MIMO system into an array of
-            # subfigures like MATLAB does.
+        # If input/output pair(s) aren't specified, use the list of all pairs
+        # (already in indices).  Otherwise, look up any names.
+        if pairs:
+            pairs = [self._indices(iu, iy) for iu, iy in pairs]
+        else:
+            pairs = self._all_pairs
+
+        # Evaluate the response of all of the pairs at once.
+        f, H = self._freqresp_pairs(pairs, kwargs)
+
+        # Create the plots, with all of the pairs in one call (one line per
+        # pair in each axes).  Then apply the color and style of each pair.
+        n_lines = len(axes[0].lines), len(axes[1].lines)
+        labels = ['$Y_{%i}/U_{%i}$' % (iy, iu) for iu, iy in pairs]
+        kwargs.pop('linestyle', None)
+        kwargs.pop('dashes', None)
+        bode_plot_response(self._pick_pairs(H, pairs).T, f, axes=axes,
+                           **kwargs)
+        for ax, n in zip(axes, n_lines):
+            for line, label, color, style in zip(ax.lines[n:], labels,
+                                                 cycle(colors), cycle(styles)):
+                line.set_label(label)
+                line.set_color(color)
+                if isinstance(style, string_types):
+                    line.set_linestyle(style)
+                else:
+                    line.set_dashes(style)
+        # 5/23/11: Since ._freqplot.bode() already uses subplots for the
+        # magnitude and phase plots, it would be difficult to modify the code
+        # to put the Bode plots of a MIMO system into an array of subfigures
+        # like MATLAB does.
 
         # Decorate and finish.
         axes[0].set_title(title)
-        if len(pairs) > 1:
-            axes[0].legend()
-            axes[1].legend()
+        if legend and len(pairs) > 1:
+            # Each pair adds one line to each axes.
+            for ax, n in zip(axes, n_lines):
+                ax.legend(ax.lines[n:], labels)
         return axes
 
     def nyquist(self, ax=None, pairs=None, label="nyquist", title=None,
                 xlabel="Real axis", ylabel="Imaginary axis",
-                colors=['b', 'g', 'r', 'c', 'm', 'y', 'k'], **kwargs):
+                colors=['b', 'g', 'r', 'c', 'm', 'y', 'k'], legend=True,
+                **kwargs):
         r"""Create a Nyquist plot of the system's response.
 
         The Nyquist plots of a MIMO system are overlayed. This is different
@@ -410,6 +1162,8 @@ class LinRes(Res):
         - *ax*: Axes onto which the Nyquist diagram should be plotted
 
              If *ax* is not provided, then axes will be created in a new figure.
+             If *ax* is 'reuse', then the figure labeled *label* is cleared and
+             reused if it exists.
 
         - *pairs*: List of (input name or index, output name or index) tuples of
           each transfer function to be evaluated
@@ -438,6 +1192,9 @@ class LinRes(Res):
 
              .. Seealso:: http://matplotlib.sourceforge.net/api/colors_api.html
 
+        - *legend*: `True`, if a legend should be added when there is more than
+          one pair
+
         - *\*\*kwargs*: Additional plotting arguments:
 
              - *freqs*: List or frequencies or tuple of (min, max) frequencies
@@ -461,7 +1218,8 @@ class LinRes(Res):
                labeled
 
              Other keyword arguments are passed to
-             :func:`matplotlib.pyplot.plot`.
+             :func:`matplotlib.pyplot.plot` (e.g., *rasterized*; see the
+             note in :mod:`modelicares.linres`).
 
         **Returns:**
 
@@ -473,37 +1231,43 @@ class LinRes(Res):
            :alt: Nyquist plot of PID
         """
         # Create axes if necessary.
-        if not ax:
-            fig = util.figure(label)
-            ax = fig.add_subplot(111, aspect='equal')
+        reuse = isinstance(ax, string_types) and ax == 'reuse'
+        if ax is None or reuse:
+            ax = _nyquist_ax(label, reuse)
 
         # Create a title if necessary.
         if title is None:
             title = "Nyquist plot of " + self.fbase
 
         # Set up the color(s).
-        if not iterable(colors):
+        if not util.iterable(colors):
             # Use the single color for all plots.
             colors = (colors,)
-        n_colors = len(colors)
-
-        # If input/output pair(s) aren't specified, generate a list of all
-        # pairs.
-        if not pairs:
-            pairs = [(iu, iy) for iu in range(self.sys.inputs)
-                     for iy in range(self.sys.outputs)]
 
-        # Create the plots.
-        for i, (iu, iy) in enumerate(pairs):
-            nyquist_plot(self.to_siso(iu, iy), ax=ax,
-                         label=r'$Y_{%i}/U_{%i}$' % (iy, iu),
-                         color=colors[np.mod(i, n_colors)], **kwargs)
-            # Note: modelicares._freqplot.nyquist() is currently only
-            # implemented for SISO systems.
+        # If input/output pair(s) aren't specified, use the list of all pairs
+        # (already in indices).  Otherwise, look up any names.
+        if pairs:
+            pairs = [self._indices(iu, iy) for iu, iy in pairs]
+        else:
+            pairs = self._all_pairs
+
+        # Evaluate the response of all of the pairs at once.
+        f, H = self._freqresp_pairs(pairs, kwargs)
+
+        # Create the plots.  Keep the handles for the legend.
+        handles = []
+        labels = []
+        for (iu, iy), H_pair, color in zip(pairs, self._pick_pairs(H, pairs),
+                                           cycle(colors)):
+            n_lines = len(ax.lines)
+            labels.append(r'$Y_{%i}/U_{%i}$' % (iy, iu))
+            nyquist_plot_response(H_pair, f, ax=ax, label=labels[-1],
+                                  color=color, **kwargs)
+            handles.append(ax.lines[n_lines])  # The primary curve
 
         # Decorate.
-        if len(pairs) > 1:
-            ax.legend()
+        if legend and len(pairs) > 1:
+            ax.legend(handles, labels)
         ax.set_title(title)
         if xlabel:  # Without this check, xlabel=None will give label of "None".
             ax.set_xlabel(xlabel)
@@ -516,15 +1280,21 @@ class LinRes(Res):
 def _get_lins(fnames):
     """Return a list of :class:`LinRes` instances from a list of filenames.
 
-    No errors are given unless no files could be loaded.
+    No errors are given unless no files could be loaded.  The files are read in
+    parallel threads since reading is mostly I/O.
     """
-    lins = []
-    for fname in fnames:
+    def load(fname):
+        """Return a :class:`LinRes` instance, or 'None' if the file can't be
+        loaded.
+        """
         try:
-            lins.append(LinRes(fname))
+            return LinRes(fname)
         except (AssertionError, IndexError, IOError, KeyError, TypeError,
                 ValueError):
-            continue
+            return None
+
+    lins = [lin for lin in _map_threads(load, list(fnames), max_threads=32)
+            if lin is not None]
     assert len(lins) > 0, "No linearizations were loaded."
     return lins
 
@@ -773,6 +1543,17 @@ class LinResList(ResList):
 
         return labels
 
+    def _pair_indices(self, pair):
+        """Return a list of (input index, output index) tuples, one for each
+        linearization, given an (input name or index, output name or index)
+        tuple (*pair*).
+
+        The pair only applies to MIMO systems.
+        """
+        return [lin._indices(*pair)
+                if lin.sys.inputs > 1 or lin.sys.outputs > 1 else (0, 0)
+                for lin in self]
+
     def bode(self, axes=None, pair=(0, 0), label='bode', title="Bode plot",
              labels=None, colors=['b', 'g', 'r', 'c', 'm', 'y', 'k'],
              styles=[(None, None), (3, 3), (1, 1), (3, 2, 1, 2)], leg_kwargs={},
@@ -787,7 +1568,8 @@ class LinResList(ResList):
         - *axes*: Tuple (pair) of axes for the magnitude and phase plots
 
              If *axes* is not provided, then axes will be created in a new
-             figure.
+             figure.  If *axes* is 'reuse', then the figure labeled *label* is
+             cleared and reused if it exists.
 
         - *pair*: Tuple of (input name or index, output name or index) for the
           transfer function to be chosen from each system (applied to all)
@@ -834,7 +1616,8 @@ class LinResList(ResList):
                over which to plot the system response.
 
                   If *freqs* is 'None', then an appropriate range will be
-                  determined automatically.
+                  determined automatically.  It is shared by all of the
+                  linearizations.
 
              - *in_Hz*: If `True` (default), the frequencies (*freqs*) are in
                Hz and should be plotted in Hz (otherwise, rad/s)
@@ -845,7 +1628,8 @@ class LinResList(ResList):
                (otherwise, radians)
 
              Other keyword arguments are passed to
-             :func:`matplotlib.pyplot.plot`.
+             :func:`matplotlib.pyplot.plot` (e.g., *rasterized*; see the
+             note in :mod:`modelicares.linres`).
 
         **Returns:**
 
@@ -857,41 +1641,44 @@ class LinResList(ResList):
            :alt: Bode plot of PID with varying parameters
         """
         # Create axes if necessary.
-        if not axes:
-            fig = util.figure(label)
-            axes = (fig.add_subplot(211), fig.add_subplot(212))
+        reuse = isinstance(axes, string_types) and axes == 'reuse'
+        if axes is None or reuse or tuple(axes) == (None, None):
+            axes = _bode_axes(label, reuse)
 
         # Process the labels input.
         labels = self._get_labels(labels)
 
         # Set up the color(s) and line style(s).
-        if not iterable(colors):
+        if not util.iterable(colors):
             # Use the single color for all plots.
             colors = (colors,)
-        if not iterable(styles):
+        if not util.iterable(styles):
             # Use the single line style for all plots.
             styles = [styles]
         elif type(styles[0]) is int:
             # One dashes tuple has been provided; use its value for all plots.
             styles = [styles]
-        n_colors = len(colors)
-        n_styles = len(styles)
 
-        # Create the plots.
-        for i, (lin, label) in enumerate(zip(self, labels)):
-            style = styles[np.mod(i, n_styles)]
-            if isinstance(style, string_types):
-                kwargs['linestyle'] = style
-                kwargs.pop('dashes', None)
-            else:
-                kwargs['dashes'] = style
-                kwargs.pop('linestyle', None)
-            if lin.sys.inputs > 1 or lin.sys.outputs > 1:
-                sys = lin.to_siso(pair[0], pair[1])
-            else:
-                sys = lin.sys
-            bode_plot(sys, label=label, color=colors[np.mod(i, n_colors)],
-                      axes=axes, **kwargs)
+        # Evaluate the responses (in parallel).
+        f, H = _freqresps(self, self._pair_indices(pair),
+                          kwargs.pop('freqs', None), kwargs.get('in_Hz', True))
+
+        # Create the plots, with all of the linearizations in one call (one
+        # line per linearization in each axes).  Then apply the label, color,
+        # and style of each linearization.
+        n_lines = len(axes[0].lines), len(axes[1].lines)
+        kwargs.pop('linestyle', None)
+        kwargs.pop('dashes', None)
+        bode_plot_response(H, f, axes=axes, **kwargs)
+        for ax, n in zip(axes, n_lines):
+            for line, label, color, style in zip(ax.lines[n:], labels,
+                                                 cycle(colors), cycle(styles)):
+                line.set_label(label)
+                line.set_color(color)
+                if isinstance(style, string_types):
+                    line.set_linestyle(style)
+                else:
+                    line.set_dashes(style)
 
         # Decorate and finish.
         axes[0].set_title(title)
@@ -916,6 +1703,8 @@ class LinResList(ResList):
         - *ax*: Axes onto which the Nyquist diagrams should be plotted
 
              If *ax* is not provided, then axes will be created in a new figure.
+             If *ax* is 'reuse', then the figure labeled *label* is cleared and
+             reused if it exists.
 
         - *pair*: Tuple of (input name or index, output name or index) for the
           transfer function to be chosen from each system (applied to all)
@@ -956,7 +1745,8 @@ class LinResList(ResList):
                over which to plot the system response.
 
                   If *freqs* is 'None', then an appropriate range will be
-                  determined automatically.
+                  determined automatically.  It is shared by all of the
+                  linearizations.
 
              - *in_Hz*: If `True` (default), the frequencies (*freqs*) are in
                Hz and should be plotted in Hz (otherwise, rad/s)
@@ -973,7 +1763,8 @@ class LinResList(ResList):
                labeled
 
              Other keyword arguments are passed to
-             :func:`matplotlib.pyplot.plot`.
+             :func:`matplotlib.pyplot.plot` (e.g., *rasterized*; see the
+             note in :mod:`modelicares.linres`).
 
         **Returns:**
 
@@ -985,30 +1776,30 @@ class LinResList(ResList):
            :alt: Nyquist plot of PID with varying parameters
         """
         # Create axes if necessary.
-        if not ax:
-            fig = util.figure(label)
-            ax = fig.add_subplot(111, aspect='equal')
+        reuse = isinstance(ax, string_types) and ax == 'reuse'
+        if ax is None or reuse:
+            ax = _nyquist_ax(label, reuse)
 
         # Process the labels input.
         labels = self._get_labels(labels)
 
         # Set up the color(s).
-        if not iterable(colors):
+        if not util.iterable(colors):
             # Use the single color for all plots.
             colors = (colors,)
-        n_colors = len(colors)
+
+        # Evaluate the responses (in parallel).
+        f, H = _freqresps(self, self._pair_indices(pair),
+                          kwargs.pop('freqs', None), kwargs.get('in_Hz', True))
 
         # Create the plots.
         label_freq = kwargs.pop('label_freq', None)
-        for i, (lin, label) in enumerate(zip(self, labels)):
-            if lin.sys.inputs > 1 or lin.sys.outputs > 1:
-                sys = lin.to_siso(pair[0], pair[1])
-            else:
-                sys = lin.sys
-            nyquist_plot(sys, mark=False, label=label, ax=ax,
-                         label_freq=(i == 0 if label_freq is None
-                                     else label_freq),
-                         color=colors[np.mod(i, n_colors)], **kwargs)
+        for i, (label, h, color) in enumerate(zip(labels, H.T,
+                                                  cycle(colors))):
+            nyquist_plot_response(h, f, mark=False, label=label, ax=ax,
+                                  label_freq=(i == 0 if label_freq is None
+                                              else label_freq),
+                                  color=color, **kwargs)
 
         # Decorate and finish.
         ax.set_title(title)
@@ -47,7 +47,6 @@ from difflib import get_close_matches
 from functools import wraps
 from itertools import cycle
 from matplotlib import rcParams
-from matplotlib.cbook import iterable
 from matplotlib.pyplot import figlegend
 from natu import core as nc
 from natu import numpy as np
@@ -2319,12 +2318,12 @@ class SimResList(ResList):
         # Set up the color(s) and dash style(s).
         cyc = type(cycle([]))
         if not isinstance(color, cyc):
-            if not iterable(color):
+            if not util.iterable(color):
                 color = [color]
             color = cycle(color)
         kwargs['color'] = color
         if not isinstance(dashes, cyc):
-            if not iterable(dashes[0]):
+            if not util.iterable(dashes[0]):
                 dashes = [dashes]
             dashes = cycle(dashes)
         kwargs['dashes'] = dashes
@@ -54,6 +54,8 @@ r"""Classes and functions to help plot and interpret experimental data
 - :func:`get_pow1000` - Return the exponent of 1000 for which the
   significand of a number is within the range [1, 1000).
 
+- :func:`iterable` - Return *True* if an object can be iterated over.
+
 - :func:`load_csv` - Load a CSV file into a dictionary.
 
 - :func:`match` - Reduce a list of strings to those that match a pattern.
@@ -126,7 +128,6 @@ from itertools import cycle
 from math import floor
 from matplotlib import rcParams
 from matplotlib._pylab_helpers import Gcf
-from matplotlib.cbook import iterable
 from matplotlib.lines import Line2D
 from natu.util import flatten_list
 from six import string_types
@@ -418,6 +419,10 @@ def figure(label='', *args, **kwargs):
 
     - *label*: String to apply to the figure's *label* property
 
+    - *reuse*: If `True` and a figure with the same *label* already exists,
+      then its axes are cleared and it is returned instead of a new figure
+      (keyword only)
+
     - *\*args*, *\*\*kwargs*: Additional arguments for
       :func:`matplotlib.pyplot.figure`
 
@@ -438,6 +443,14 @@ def figure(label='', *args, **kwargs):
     .. Note::  The *label* property is used as the base filename in the
        :func:`save` and :func:`saveall` functions.
     """
+    if kwargs.pop('reuse', False):
+        for manager in Gcf.figs.values():
+            fig = manager.canvas.figure
+            if fig.get_label() == label:
+                for ax in fig.axes:
+                    ax.cla()
+                plt.figure(fig.number)  # Make it the current figure.
+                return fig
     fig = plt.figure(*args, **kwargs)
     plt.setp(fig, 'label', label)
     # Note:  As of matplotlib 1.2, matplotlib.pyplot.figure(label=label) isn't
@@ -469,14 +482,15 @@ def flatten_dict(d, parent_key='', separator='.'):
     # From
     # http://stackoverflow.com/questions/6027558/flatten-nested-python-dictionaries-compressing-keys,
     # 11/5/2012
-    items = []
+    prefix = parent_key + separator if parent_key else ''
+    items = {}
     for key, value in d.items():
-        new_key = parent_key + separator + key if parent_key else key
         if isinstance(value, MutableMapping):
-            items.extend(flatten_dict(value, new_key).items())
+            if value:  # Empty branches have no leaves.
+                items.update(flatten_dict(value, prefix + key, separator))
         else:
-            items.append((new_key, value))
-    return dict(items)
+            items[prefix + key] = value
+    return items
 
 
 def _gen_offset_factor(label, tick_lo, tick_up, eagerness=0.325):
@@ -607,6 +621,25 @@ def get_pow1000(num):
     return int(floor(dnum.log10() / 3))
 
 
+def iterable(obj):
+    """Return *True* if an object can be iterated over.
+
+    This is a duck-typed replacement for :func:`matplotlib.cbook.iterable`,
+    which has been removed from recent versions of matplotlib.  As before,
+    strings are considered iterable.
+
+    **Example:**
+
+    >>> iterable([1, 2]), iterable('ab'), iterable(1)
+    (True, True, False)
+    """
+    try:
+        iter(obj)
+    except TypeError:
+        return False
+    return True
+
+
 def load_csv(fname, header_row=0, first_data_row=None, types=None, **kwargs):
     r"""Load a CSV file into a dictionary.
 
@@ -1776,6 +1809,11 @@ class ParamDict(dict):
     >>> print(ParamDict({}))
     <BLANKLINE>
 
+    Nested dictionaries are split at the dots too:
+
+    >>> print(ParamDict({'a': ParamDict({'b.c': 1, 'b.d': 2}), 'x': 3}))
+    (a(b(c=1, d=2)), x=3)
+
 
     .. _NumPy: http://numpy.scipy.org/
     """
@@ -1791,18 +1829,30 @@ class ParamDict(dict):
             Substitutions are made to properly represent Boolean variables and
             arrays in Modelica_.
             """
-            elements = []
+            string = ', '.join(_elements(dictionary))
+            return '(%s)' % string if string else ''
+
+        def _elements(dictionary):
+            """Generate the modifier of each item in a dictionary.
+            """
             for key, value in sorted(dictionary.items()):
-                if isinstance(value, ParamDict):
-                    elements.append('%s%s' % (key, value)) # Recursive
+                if isinstance(value, _Branch):
+                    yield key + _str(value) # Recursive (tree is already built)
                 elif isinstance(value, dict):
-                    elements.append('%s%s' % (key, ParamDict(value))) # Ditto
+                    yield '%s%s' % (key, ParamDict(value))
                 elif value is not None:
-                    value = modelica_str(value)
-                    elements.append(key + '=' + value)
-            return '(%s)' % ', '.join(elements) if elements else ''
+                    yield key + '=' + modelica_str(value)
+
+        return _str(tree(self.keys(), self.values(), container=_Branch))
 
-        return _str(tree(self.keys(), self.values(), container=ParamDict))
+
+class _Branch(dict):
+
+    """Branch of the tree built by :meth:`ParamDict.__str__`
+
+    Its keys have already been split at the dots, unlike those of a
+    :class:`ParamDict` or :class:`dict` given as a value.
+    """
 
 
 # Getch classes based on
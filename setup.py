@@ -57,10 +57,10 @@ setup(name='ModelicaRes',
       packages=['modelicares', 'modelicares.exps', 'modelicares._io'],
       package_data={'modelicares': ['display.ini']},
       scripts=glob('bin/*'),
-      install_requires=['numpy', 'matplotlib>=1.3.1', 'natu', 'pandas',
+      install_requires=['numpy>=1.10', 'matplotlib>=1.3.1', 'natu', 'pandas',
                         'control', 'six'],
-      requires=['numpy', 'scipy (>=0.10.0)', 'matplotlib (>=1.3.1)', 'natu',
-                'pandas', 'control', 'six'],
+      requires=['numpy (>=1.10)', 'scipy (>=0.10.0)', 'matplotlib (>=1.3.1)',
+                'natu', 'pandas', 'control', 'six'],
       platforms='any',
       zip_safe=False, # because display.ini must be accessed
       test_suite = 'tests.test_suite',